@@ -0,0 +1,55 @@
+"""
+Numeric kernels for Parallax Index.
+
+Hot numeric loops live here so they can optionally be JIT-compiled with
+numba. numba is not a hard dependency: when it is unavailable the
+kernels fall back to equivalent NumPy implementations.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+
+def _ols_slope(y: np.ndarray) -> float:
+    """
+    Closed-form OLS slope of y against x = 0..n-1.
+
+    Single pass accumulating sum_x, sum_y, sum_xy, sum_xx with no
+    intermediate arrays.
+    """
+    n = y.shape[0]
+    sx = sy = sxy = sxx = 0.0
+    for i in range(n):
+        sx += i
+        sy += y[i]
+        sxy += i * y[i]
+        sxx += i * i
+
+    denominator = n * sxx - sx * sx
+    if denominator == 0.0:
+        return 0.0
+    return (n * sxy - sx * sy) / denominator
+
+
+def _ols_slope_numpy(y: np.ndarray) -> float:
+    """NumPy fallback: same slope via dot products and analytic x sums."""
+    n = y.shape[0]
+    x = np.arange(n, dtype=np.float64)
+
+    sx = (n - 1) * n / 2
+    sxx = (n - 1) * n * (2 * n - 1) / 6
+
+    denominator = n * sxx - sx * sx
+    if denominator == 0:
+        return 0.0
+    return float((n * np.dot(x, y) - sx * y.sum()) / denominator)
+
+
+if njit is not None:
+    ols_slope = njit(cache=True, fastmath=True)(_ols_slope)
+else:
+    ols_slope = _ols_slope_numpy
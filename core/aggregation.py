@@ -7,6 +7,9 @@ Combines distilled snapshots from multiple sources into global sentiment metrics
 import math
 from typing import Optional
 
+import numpy as np
+
+from core._kernels import ols_slope
 from core.schemas import DistilledSnapshot, GlobalSentiment, SourceInstance
 from storage.database import Database
 
@@ -26,71 +29,110 @@ class AggregationEngine:
             db: Database instance for fetching sources and snapshots
         """
         self.db = db
+        # Memoized (key, result) for compute_global_sentiment; the key is
+        # derived from the contributing snapshot timestamps, so new data
+        # invalidates it automatically
+        self._global_cache: Optional[tuple[tuple, GlobalSentiment]] = None
     
+    async def _latest_snapshots(self) -> list[tuple[SourceInstance, DistilledSnapshot]]:
+        """
+        Fetch the latest snapshot for each enabled source.
+
+        Returns:
+            List of (source, snapshot) pairs, excluding sources without data
+        """
+        sources = await self.db.list_sources(enabled_only=True)
+
+        if not sources:
+            return []
+
+        # Single bulk query instead of one round-trip per source
+        latest = await self.db.get_latest_snapshots_for(
+            [s.source_id for s in sources]
+        )
+
+        return [
+            (source, latest[source.source_id])
+            for source in sources
+            if source.source_id in latest
+        ]
+
     async def compute_global_sentiment(self) -> Optional[GlobalSentiment]:
         """
         Compute current global sentiment from all enabled sources.
-        
+
         Algorithm:
         1. Get latest snapshot for each enabled source
         2. Apply source weights and confidence weights
         3. Compute weighted average sentiment
         4. Calculate global volatility and confidence
-        
+
+        Returns:
+            GlobalSentiment or None if no data available
+        """
+        return self.aggregate_latest(await self._latest_snapshots())
+
+    def aggregate_latest(
+        self,
+        snapshots: list[tuple[SourceInstance, DistilledSnapshot]]
+    ) -> Optional[GlobalSentiment]:
+        """
+        Aggregate already-fetched (source, snapshot) pairs.
+
+        Pure-compute half of compute_global_sentiment, split out so
+        callers that have the latest snapshots in hand (the dashboard)
+        don't re-query for them. Shares the same memo.
+
+        Args:
+            snapshots: (source, latest snapshot) pairs for enabled sources
+
         Returns:
             GlobalSentiment or None if no data available
         """
-        # Get all enabled sources
-        sources = await self.db.list_sources(enabled_only=True)
-        
-        if not sources:
-            return None
-        
-        # Get latest snapshot for each source
-        snapshots: list[tuple[SourceInstance, DistilledSnapshot]] = []
-        
-        for source in sources:
-            snapshot = await self.db.get_latest_snapshot(source.source_id)
-            if snapshot:
-                snapshots.append((source, snapshot))
-        
         if not snapshots:
             return None
-        
-        # Compute weighted sentiment
-        total_weight = 0.0
-        weighted_sentiment = 0.0
-        total_volatility = 0.0
-        total_confidence_weight = 0.0
-        
-        for source, snapshot in snapshots:
-            # Effective weight is source weight * confidence
-            effective_weight = source.weight * snapshot.sentiment_confidence
-            
-            weighted_sentiment += snapshot.sentiment * effective_weight
-            total_volatility += snapshot.volatility * effective_weight
-            total_weight += effective_weight
-            total_confidence_weight += snapshot.sentiment_confidence * source.weight
-        
+
+        # Cache hit: same sources and weights, no newer snapshots
+        cache_key = tuple(sorted(
+            (str(source.source_id), source.weight, snapshot.timestamp.isoformat())
+            for source, snapshot in snapshots
+        ))
+        if self._global_cache and self._global_cache[0] == cache_key:
+            return self._global_cache[1]
+
+        # Compute weighted sentiment with NumPy (one C loop per reduction
+        # instead of per-snapshot Python arithmetic)
+        count = len(snapshots)
+        weights = np.fromiter((s.weight for s, _ in snapshots), dtype=np.float64, count=count)
+        confidences = np.fromiter((snap.sentiment_confidence for _, snap in snapshots), dtype=np.float64, count=count)
+        sentiments = np.fromiter((snap.sentiment for _, snap in snapshots), dtype=np.float64, count=count)
+        volatilities = np.fromiter((snap.volatility for _, snap in snapshots), dtype=np.float64, count=count)
+
+        # Effective weight is source weight * confidence
+        effective = weights * confidences
+        total_weight = effective.sum()
+
         if total_weight == 0:
             return None
-        
+
         # Normalize
-        global_sentiment = weighted_sentiment / total_weight
-        global_volatility = total_volatility / total_weight
-        
+        global_sentiment = np.dot(sentiments, effective) / total_weight
+        global_volatility = np.dot(volatilities, effective) / total_weight
+
         # Calculate global confidence (average of confidence-weighted sources)
         # Adjust down if we have very few sources
-        source_count = len(snapshots)
+        source_count = count
         diversity_factor = min(1.0, source_count / 5)  # Penalize < 5 sources
-        global_confidence = (total_confidence_weight / sum(s.weight for s, _ in snapshots)) * diversity_factor
+        global_confidence = (total_weight / weights.sum()) * diversity_factor
         
-        return GlobalSentiment(
+        result = GlobalSentiment(
             global_sentiment=global_sentiment,
             confidence=global_confidence,
             source_count=source_count,
             volatility=global_volatility
         )
+        self._global_cache = (cache_key, result)
+        return result
     
     async def compute_source_contribution(
         self,
@@ -105,27 +147,59 @@ class AggregationEngine:
         Returns:
             Contribution factor (0-1) or None if not applicable
         """
-        # Get global with this source
-        global_with = await self.compute_global_sentiment()
-        
-        if not global_with:
-            return None
-        
-        # Temporarily disable source and recalculate
-        source = await self.db.get_source(source_id)
-        if not source or not source.enabled:
+        snapshots = await self._latest_snapshots()
+
+        if not snapshots:
             return None
-        
-        # Get snapshot to calculate individual contribution
-        snapshot = await self.db.get_latest_snapshot(source_id)
-        if not snapshot:
+
+        # Contribution is this source's share of the total effective weight,
+        # computed in closed form from the same arrays as the global metric —
+        # no need to re-run the full aggregation
+        source_eff = None
+        total_weight = 0.0
+
+        for source, snapshot in snapshots:
+            effective_weight = source.weight * snapshot.sentiment_confidence
+            total_weight += effective_weight
+            if source.source_id == source_id:
+                source_eff = effective_weight
+
+        if source_eff is None or total_weight == 0:
             return None
-        
-        # Contribution is based on weight and sentiment deviation
-        contribution = abs(snapshot.sentiment) * source.weight / 10.0
-        
-        return min(1.0, contribution)
+
+        return min(1.0, source_eff / total_weight)
     
+    async def get_sentiment_trends(
+        self,
+        window_size: int = 10
+    ) -> dict:
+        """
+        Calculate sentiment trends for all sources in one database pass.
+
+        Same regression as get_sentiment_trend, but the windows for
+        every source come back from a single batched query instead of
+        one history fetch per source.
+
+        Args:
+            window_size: Number of recent snapshots to analyze per source
+
+        Returns:
+            Mapping of source_id to trend (-1 to +1); sources with
+            insufficient data are omitted
+        """
+        windows = await self.db.get_recent_sentiments(window_size)
+
+        trends = {}
+        for source_id, sentiments in windows.items():
+            if len(sentiments) < 3:
+                continue
+            n = len(sentiments)
+            # Newest-first from the query; reverse to chronological
+            y = np.fromiter(sentiments, dtype=np.float64, count=n)[::-1]
+            slope = ols_slope(y)
+            trends[source_id] = max(-1.0, min(1.0, slope * 10))
+        return trends
+
     async def get_sentiment_trend(
         self,
         source_id,
@@ -147,24 +221,14 @@ class AggregationEngine:
         if len(history) < 3:
             return None
         
-        # Reverse to get chronological order
-        history = list(reversed(history))
-        
-        # Simple linear regression on sentiment values
-        sentiments = [s.sentiment for s in history]
-        n = len(sentiments)
-        
-        # Calculate slope
-        x_mean = (n - 1) / 2
-        y_mean = sum(sentiments) / n
-        
-        numerator = sum((i - x_mean) * (sentiments[i] - y_mean) for i in range(n))
-        denominator = sum((i - x_mean) ** 2 for i in range(n))
-        
-        if denominator == 0:
-            return 0.0
-        
-        slope = numerator / denominator
+        # Simple linear regression on sentiment values; the closed-form
+        # OLS slope kernel is JIT-compiled when numba is available.
+        # History arrives newest-first, so reverse to chronological order
+        # via a zero-copy slice view rather than a new list
+        n = len(history)
+        y = np.fromiter((s.sentiment for s in history), dtype=np.float64, count=n)[::-1]
+
+        slope = ols_slope(y)
         
         # Normalize to -1 to +1 range
         # A slope of 0.1 per snapshot is considered strong
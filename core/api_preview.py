@@ -5,9 +5,27 @@ Provides functionality to test API endpoints and explore their structure
 before creating a source instance.
 """
 
+import time
 from typing import Any, Optional
 
 import httpx
+import orjson
+
+# Cap on how much of a response body we buffer — previews only need the
+# head of the payload, not a multi-MB dump
+MAX_PREVIEW_BODY = 1 << 20  # 1 MiB
+
+# Shared client so repeated previews reuse pooled connections instead of
+# paying TCP/TLS setup per call. Created lazily on first use.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get (or lazily create) the shared AsyncClient."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient()
+    return _client
 
 
 class APIPreviewResult:
@@ -59,60 +77,74 @@ async def preview_api_endpoint(
     Returns:
         APIPreviewResult with the response data or error
     """
-    from datetime import datetime
-    
-    start_time = datetime.utcnow()
-    
+    start_ns = time.perf_counter_ns()
+
+    method = method.upper()
+    if method not in ("GET", "POST"):
+        return APIPreviewResult(
+            success=False,
+            error=f"Unsupported HTTP method: {method}"
+        )
+
     try:
-        async with httpx.AsyncClient() as client:
-            if method.upper() == "GET":
-                response = await client.get(url, timeout=timeout, headers=headers or {})
-            elif method.upper() == "POST":
-                response = await client.post(url, timeout=timeout, headers=headers or {})
-            else:
-                return APIPreviewResult(
-                    success=False,
-                    error=f"Unsupported HTTP method: {method}"
-                )
-            
-            end_time = datetime.utcnow()
-            response_time_ms = (end_time - start_time).total_seconds() * 1000
-            
+        client = _get_client()
+
+        # Stream the body so a huge endpoint can't blow memory — we stop
+        # reading once the preview cap is reached
+        truncated = False
+        body = bytearray()
+
+        async with client.stream(
+            method, url, timeout=timeout, headers=headers or {}
+        ) as response:
+            status_code = response.status_code
             content_type = response.headers.get("content-type", "unknown")
-            
-            # Try to parse as JSON first
+
+            async for chunk in response.aiter_bytes():
+                body.extend(chunk)
+                if len(body) > MAX_PREVIEW_BODY:
+                    truncated = True
+                    del body[MAX_PREVIEW_BODY:]
+                    break
+
+        response_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+        # Try to parse as JSON first (a truncated body won't parse, and
+        # falls through to the text branch)
+        try:
+            data = orjson.loads(bytes(body))
+            return APIPreviewResult(
+                success=True,
+                data=data,
+                content_type=content_type,
+                status_code=status_code,
+                response_time_ms=response_time_ms
+            )
+        except Exception:
+            # Not JSON, return as text
+            text = bytes(body).decode("utf-8", "replace")
+            if truncated:
+                text += "… (truncated)"
+
+            # Try to parse as a number
             try:
-                data = response.json()
+                number = float(text.strip())
                 return APIPreviewResult(
                     success=True,
-                    data=data,
+                    data={"value": number, "_raw_text": text},
                     content_type=content_type,
-                    status_code=response.status_code,
+                    status_code=status_code,
+                    response_time_ms=response_time_ms
+                )
+            except ValueError:
+                # Just return as text
+                return APIPreviewResult(
+                    success=True,
+                    data={"_raw_text": text},
+                    content_type=content_type,
+                    status_code=status_code,
                     response_time_ms=response_time_ms
                 )
-            except Exception:
-                # Not JSON, return as text
-                text = response.text
-                
-                # Try to parse as a number
-                try:
-                    number = float(text.strip())
-                    return APIPreviewResult(
-                        success=True,
-                        data={"value": number, "_raw_text": text},
-                        content_type=content_type,
-                        status_code=response.status_code,
-                        response_time_ms=response_time_ms
-                    )
-                except ValueError:
-                    # Just return as text
-                    return APIPreviewResult(
-                        success=True,
-                        data={"_raw_text": text},
-                        content_type=content_type,
-                        status_code=response.status_code,
-                        response_time_ms=response_time_ms
-                    )
     
     except httpx.TimeoutException:
         return APIPreviewResult(
@@ -131,48 +163,84 @@ async def preview_api_endpoint(
         )
 
 
-def extract_all_paths(data: Any, prefix: str = "") -> list[tuple[str, Any, str]]:
+# Maps exact value types to display names, replacing per-node isinstance chains.
+# bool must stay distinct from int, which an exact-type lookup gives us for free.
+_TYPE_NAMES = {
+    bool: "boolean",
+    int: "number",
+    float: "number",
+    str: "string",
+    dict: "dict (nested)",
+    list: "list (nested)",
+}
+
+
+def _kind(value: Any) -> str:
+    """Display type for a value: exact-type lookup, isinstance fallback."""
+    kind = _TYPE_NAMES.get(type(value))
+    if kind is not None:
+        return kind
+    if isinstance(value, (dict, list)):
+        return f"{type(value).__name__} (nested)"
+    return type(value).__name__
+
+
+def _iter_paths(data: Any, prefix: str = "", max_depth: int = 20):
+    """
+    Yield (path, value, type, preview) tuples depth-first without recursion.
+
+    Children are pushed in reverse so pop() walks them in source order,
+    each entry immediately followed by its own subtree — the same
+    pre-order the recursive version produced, which the preview UI
+    relies on to keep paths grouped under their parent.
+    """
+    stack: list[tuple[str, Any, int, str]] = []
+
+    def push_children(node: Any, path: str, depth: int) -> None:
+        if depth >= max_depth:
+            return
+
+        if isinstance(node, dict):
+            for key, value in reversed(node.items()):
+                current_path = f"{path}.{key}" if path else key
+                stack.append((current_path, value, depth + 1, _kind(value)))
+
+        elif isinstance(node, list) and node:
+            # For arrays, show the first item's structure
+            first_item = node[0]
+            stack.append(
+                (f"{path}[0]", first_item, depth + 1, type(first_item).__name__)
+            )
+
+    push_children(data, prefix, 0)
+
+    while stack:
+        path, value, depth, kind = stack.pop()
+
+        if isinstance(value, (dict, list)):
+            yield path, value, kind, f"<{kind}>"
+            push_children(value, path, depth)
+        else:
+            yield path, value, kind, str(value)[:100]
+
+
+def extract_all_paths(
+    data: Any,
+    prefix: str = "",
+    max_depth: int = 20
+) -> list[tuple[str, Any, str, str]]:
     """
     Extract all possible JSON paths from data structure.
-    
+
+    The display preview is rendered here, during the one walk over the
+    structure, so callers don't re-test every node to build it.
+
     Args:
         data: Data to extract paths from
         prefix: Current path prefix
-        
+        max_depth: Nesting depth beyond which structures are not descended
+
     Returns:
-        List of (path, value, type) tuples
+        List of (path, value, type, preview) tuples
     """
-    paths = []
-    
-    if isinstance(data, dict):
-        for key, value in data.items():
-            current_path = f"{prefix}.{key}" if prefix else key
-            
-            # Add this path
-            value_type = type(value).__name__
-            if isinstance(value, (int, float)):
-                value_type = "number"
-            elif isinstance(value, str):
-                value_type = "string"
-            elif isinstance(value, bool):
-                value_type = "boolean"
-            elif isinstance(value, (dict, list)):
-                value_type = f"{value_type} (nested)"
-            
-            paths.append((current_path, value, value_type))
-            
-            # Recurse if nested
-            if isinstance(value, (dict, list)):
-                paths.extend(extract_all_paths(value, current_path))
-    
-    elif isinstance(data, list) and len(data) > 0:
-        # For arrays, show the first item's structure
-        current_path = f"{prefix}[0]"
-        first_item = data[0]
-        
-        paths.append((current_path, first_item, type(first_item).__name__))
-        
-        if isinstance(first_item, (dict, list)):
-            paths.extend(extract_all_paths(first_item, current_path))
-    
-    return paths
+    return list(_iter_paths(data, prefix, max_depth))
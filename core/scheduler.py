@@ -5,15 +5,34 @@ Manages periodic collection and distillation of data sources.
 """
 
 import asyncio
-from datetime import datetime
+import functools
+import logging
+import time
 from typing import Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
-from core.schemas import RawSnapshot
+from core.schemas import RawSnapshot, SourceInstance
 from plugins.registry import get_registry
-from storage.database import Database
+from storage.database import Database, SnapshotWriter
+
+logger = logging.getLogger(__name__)
+
+# Success-line format shared across collections; floats are only
+# formatted when INFO is actually emitted
+_COLLECT_OK_FMT = "%s: sentiment=%.3f, confidence=%.3f, volatility=%.3f (%.2fs)"
+
+
+@functools.lru_cache(maxsize=256)
+def _cron_trigger(schedule: str) -> CronTrigger:
+    """
+    Parse a crontab string into a CronTrigger, memoized per schedule.
+
+    Triggers are immutable for scheduling purposes, so sharing one
+    instance across sources with the same cadence is safe.
+    """
+    return CronTrigger.from_crontab(schedule)
 
 
 class CollectionScheduler:
@@ -34,6 +53,13 @@ class CollectionScheduler:
         self.scheduler = AsyncIOScheduler()
         self.registry = get_registry()
         self._job_ids: dict[str, str] = {}  # source_id -> job_id mapping
+        # Sources cached at (re)schedule time so each cron tick doesn't
+        # re-query the DB; entries are refreshed by schedule_source and
+        # dropped by unschedule_source
+        self._sources: dict[str, SourceInstance] = {}
+        # Coalesces snapshot writes from concurrent collections into
+        # bulk inserts
+        self._writer = SnapshotWriter(db)
     
     async def start(self) -> None:
         """
@@ -45,20 +71,28 @@ class CollectionScheduler:
         await self._schedule_all_sources()
         
         # Start the scheduler
+        self._writer.start()
         self.scheduler.start()
-        print("Collection scheduler started")
-    
-    def stop(self) -> None:
-        """Stop the scheduler."""
+        logger.info("Collection scheduler started")
+
+    async def stop(self) -> None:
+        """Stop the scheduler and flush any buffered snapshots."""
         self.scheduler.shutdown(wait=False)
-        print("Collection scheduler stopped")
+
+        # Awaited, not fired-and-forgotten: the loop is torn down right
+        # after shutdown returns, so a detached task would be cancelled
+        # before the final flush ran
+        await self._writer.aclose()
+
+        logger.info("Collection scheduler stopped")
     
     async def _schedule_all_sources(self) -> None:
         """Schedule collection jobs for all enabled sources."""
         sources = await self.db.list_sources(enabled_only=True)
-        
-        for source in sources:
-            await self.schedule_source(str(source.source_id))
+
+        await asyncio.gather(
+            *(self.schedule_source(str(source.source_id)) for source in sources)
+        )
     
     async def schedule_source(self, source_id: str) -> None:
         """
@@ -77,8 +111,8 @@ class CollectionScheduler:
         if source_id in self._job_ids:
             self.scheduler.remove_job(self._job_ids[source_id])
         
-        # Parse schedule (cron format)
-        trigger = CronTrigger.from_crontab(source.schedule)
+        # Parse schedule (cron format), cached per distinct schedule string
+        trigger = _cron_trigger(source.schedule)
         
         # Add job
         job = self.scheduler.add_job(
@@ -92,7 +126,8 @@ class CollectionScheduler:
         )
         
         self._job_ids[source_id] = job.id
-        print(f"Scheduled source: {source.display_name} ({source.schedule})")
+        self._sources[source_id] = source
+        logger.info("Scheduled source: %s (%s)", source.display_name, source.schedule)
     
     async def unschedule_source(self, source_id: str) -> None:
         """
@@ -101,14 +136,49 @@ class CollectionScheduler:
         Args:
             source_id: UUID string of the source
         """
+        self._sources.pop(source_id, None)
         if source_id in self._job_ids:
             try:
                 self.scheduler.remove_job(self._job_ids[source_id])
                 del self._job_ids[source_id]
-                print(f"Unscheduled source: {source_id}")
+                logger.info("Unscheduled source: %s", source_id)
             except Exception as e:
-                print(f"Error unscheduling source {source_id}: {e}")
+                logger.warning("Error unscheduling source %s: %s", source_id, e)
     
+    async def collect_all_now(self) -> int:
+        """
+        Trigger immediate collection for all enabled sources.
+
+        Returns:
+            Number of sources dispatched
+        """
+        sources = await self.db.list_sources(enabled_only=True)
+        source_ids = [str(source.source_id) for source in sources]
+        await self._collect_many(source_ids)
+        return len(source_ids)
+
+    async def _collect_many(self, source_ids: list[str]) -> None:
+        """
+        Run collection for several sources concurrently.
+
+        Network waits overlap, while a semaphore caps in-flight
+        collections so a large source list can't stampede the DB or
+        remote endpoints.
+
+        Args:
+            source_ids: UUID strings of the sources to collect
+        """
+        semaphore = asyncio.Semaphore(8)
+
+        async def _one(source_id: str) -> None:
+            async with semaphore:
+                await self._collect_and_distill(source_id)
+
+        await asyncio.gather(
+            *(_one(source_id) for source_id in source_ids),
+            return_exceptions=True
+        )
+
     async def collect_now(self, source_id: str) -> Optional[str]:
         """
         Trigger immediate collection for a source.
@@ -123,10 +193,8 @@ class CollectionScheduler:
             await self._collect_and_distill(source_id)
             return f"Collection completed for {source_id}"
         except Exception as e:
-            import traceback
-            error_msg = f"Collection failed: {str(e)}\n{traceback.format_exc()}"
-            print(error_msg)
-            return error_msg
+            logger.exception("Collection failed for %s", source_id)
+            return f"Collection failed: {e}"
     
     async def _collect_and_distill(self, source_id: str) -> None:
         """
@@ -144,52 +212,57 @@ class CollectionScheduler:
         Args:
             source_id: UUID string of the source
         """
-        start_time = datetime.utcnow()
-        
+        start_ns = time.perf_counter_ns()
+
         try:
-            # Load source
-            from uuid import UUID
-            source = await self.db.get_source(UUID(source_id))
+            # Load source (cached copy from schedule time if available,
+            # avoiding a DB round-trip per tick)
+            source = self._sources.get(source_id)
+            if source is None:
+                from uuid import UUID
+                source = await self.db.get_source(UUID(source_id))
             if not source:
-                print(f"Source {source_id} not found")
+                logger.warning("Source %s not found", source_id)
                 return
             
             if not source.enabled:
-                print(f"Source {source_id} is disabled, skipping")
+                logger.debug("Source %s is disabled, skipping", source_id)
                 return
             
             # Get plugin
             plugin = self.registry.get_plugin(source.plugin_id)
             if not plugin:
-                print(f"Plugin {source.plugin_id} not found for source {source_id}")
+                logger.warning("Plugin %s not found for source %s", source.plugin_id, source_id)
                 return
             
             # Collect raw data
-            print(f"Collecting: {source.display_name}")
+            logger.info("Collecting: %s", source.display_name)
             raw = await plugin.collect(source)
             
-            # Get history for distillation
+            # Get history for distillation (newest-first from the DB;
+            # reverse in place to chronological order, no extra copy)
             history = await self.db.get_snapshot_history(source.source_id, limit=50)
-            
+            history.reverse()
+
             # Distill
-            distilled = await plugin.distill(raw, list(reversed(history)), source)
+            distilled = await plugin.distill(raw, history, source)
             
-            # Save distilled snapshot
-            await self.db.save_snapshot(distilled)
+            # Save distilled snapshot (coalesced into batched inserts)
+            await self._writer.submit(distilled)
             
-            end_time = datetime.utcnow()
-            duration = (end_time - start_time).total_seconds()
-            
-            print(
-                f"✓ {source.display_name}: "
-                f"sentiment={distilled.sentiment:.3f}, "
-                f"confidence={distilled.sentiment_confidence:.3f}, "
-                f"volatility={distilled.volatility:.3f} "
-                f"({duration:.2f}s)"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
+                logger.info(
+                    _COLLECT_OK_FMT,
+                    source.display_name,
+                    distilled.sentiment,
+                    distilled.sentiment_confidence,
+                    distilled.volatility,
+                    duration
+                )
             
             # Raw data is now discarded (Python GC handles this)
         
-        except Exception as e:
-            print(f"✗ Collection failed for {source_id}: {e}")
+        except Exception:
+            logger.exception("Collection failed for %s", source_id)
             # In production, would log to monitoring system
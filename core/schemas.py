@@ -5,38 +5,40 @@ These schemas define the canonical data structures for the system.
 All schemas are designed to be stable across versions.
 """
 
-from datetime import datetime
-from enum import Enum
-from typing import Any, Optional
+from dataclasses import dataclass
+from dataclasses import field as _dc_field
+from datetime import UTC, datetime
+from typing import Any, Literal, Optional, get_args
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
+# Category of data source.
+#
+# - TEXT: Sources that produce textual content (articles, social media, etc.)
+# - NUMERIC: Sources that produce numeric indices (stock prices, indicators, etc.)
+# - EVENT: Sources that track discrete events (protests, policy changes, etc.)
+#
+# Literal rather than Enum: pydantic-core validates Literal strings without
+# the per-validate Enum lookup/construction, and the JSON wire values are
+# identical.
+SourceCategory = Literal["TEXT", "NUMERIC", "EVENT"]
 
-class SourceCategory(str, Enum):
-    """
-    Category of data source.
-    
-    - TEXT: Sources that produce textual content (articles, social media, etc.)
-    - NUMERIC: Sources that produce numeric indices (stock prices, indicators, etc.)
-    - EVENT: Sources that track discrete events (protests, policy changes, etc.)
-    """
-    TEXT = "TEXT"
-    NUMERIC = "NUMERIC"
-    EVENT = "EVENT"
+# Expected sentiment polarity of a source.
+#
+# - POSITIVE_IS_GOOD: Higher values indicate positive sentiment
+# - NEGATIVE_IS_GOOD: Lower values indicate positive sentiment (e.g., unemployment rate)
+# - NEUTRAL: No inherent directional interpretation
+SentimentPolarity = Literal["POSITIVE_IS_GOOD", "NEGATIVE_IS_GOOD", "NEUTRAL"]
 
+# Allowed values, for UI dropdowns and membership checks
+SOURCE_CATEGORIES: tuple[str, ...] = get_args(SourceCategory)
+SENTIMENT_POLARITIES: tuple[str, ...] = get_args(SentimentPolarity)
 
-class SentimentPolarity(str, Enum):
-    """
-    Expected sentiment polarity of a source.
-    
-    - POSITIVE_IS_GOOD: Higher values indicate positive sentiment
-    - NEGATIVE_IS_GOOD: Lower values indicate positive sentiment (e.g., unemployment rate)
-    - NEUTRAL: No inherent directional interpretation
-    """
-    POSITIVE_IS_GOOD = "POSITIVE_IS_GOOD"
-    NEGATIVE_IS_GOOD = "NEGATIVE_IS_GOOD"
-    NEUTRAL = "NEUTRAL"
+
+def _utcnow() -> datetime:
+    """Timezone-aware UTC now; default factory for timestamp fields."""
+    return datetime.now(UTC)
 
 
 class PluginDefinition(BaseModel):
@@ -65,24 +67,23 @@ class PluginDefinition(BaseModel):
         description="JSON Schema defining required configuration parameters"
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "plugin_id": "numeric_index",
-                "plugin_version": "1.0.0",
-                "display_name": "Numeric Index",
-                "description": "Tracks a single numeric value from a URL",
-                "source_category": "NUMERIC",
-                "config_schema": {
-                    "type": "object",
-                    "properties": {
-                        "url": {"type": "string", "format": "uri"},
-                        "baseline": {"type": "number"}
-                    },
-                    "required": ["url"]
-                }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "plugin_id": "numeric_index",
+            "plugin_version": "1.0.0",
+            "display_name": "Numeric Index",
+            "description": "Tracks a single numeric value from a URL",
+            "source_category": "NUMERIC",
+            "config_schema": {
+                "type": "object",
+                "properties": {
+                    "url": {"type": "string", "format": "uri"},
+                    "baseline": {"type": "number"}
+                },
+                "required": ["url"]
             }
         }
+    })
 
 
 class SourceInstance(BaseModel):
@@ -113,55 +114,52 @@ class SourceInstance(BaseModel):
         description="Weight of this source in global aggregation (0-10)"
     )
     sentiment_polarity: SentimentPolarity = Field(
-        default=SentimentPolarity.POSITIVE_IS_GOOD,
+        default="POSITIVE_IS_GOOD",
         description="How to interpret sentiment direction"
     )
     schedule: str = Field(
         default="0 * * * *",  # Every hour at minute 0
         description="Cron-style schedule for collection"
     )
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "source_id": "550e8400-e29b-41d4-a716-446655440000",
-                "plugin_id": "numeric_index",
-                "display_name": "S&P 500 Index",
-                "enabled": True,
-                "config": {
-                    "url": "https://api.example.com/sp500",
-                    "baseline": 4000.0
-                },
-                "weight": 2.0,
-                "sentiment_polarity": "POSITIVE_IS_GOOD",
-                "schedule": "0 * * * *",
-                "created_at": "2026-01-14T12:00:00Z"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "source_id": "550e8400-e29b-41d4-a716-446655440000",
+            "plugin_id": "numeric_index",
+            "display_name": "S&P 500 Index",
+            "enabled": True,
+            "config": {
+                "url": "https://api.example.com/sp500",
+                "baseline": 4000.0
+            },
+            "weight": 2.0,
+            "sentiment_polarity": "POSITIVE_IS_GOOD",
+            "schedule": "0 * * * *",
+            "created_at": "2026-01-14T12:00:00Z"
         }
+    })
 
 
-class RawSnapshot(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RawSnapshot:
     """
     Ephemeral snapshot of raw collected data.
-    
+
     Raw snapshots are NOT persisted long-term. They exist only
-    during the collect -> distill pipeline and are then discarded.
+    during the collect -> distill pipeline and are then discarded —
+    so this is a plain slotted dataclass rather than a pydantic
+    model: no validation on a type that lives for one pipeline pass,
+    and no per-instance __dict__.
     """
-    source_id: UUID = Field(
-        description="ID of the source that collected this data"
-    )
-    collected_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        description="When this data was collected"
-    )
-    payload: Any = Field(
-        description="Raw data in plugin-specific format"
-    )
-    diagnostics: dict[str, Any] = Field(
-        default_factory=dict,
-        description="Metadata about collection (response time, errors, etc.)"
-    )
+    # ID of the source that collected this data
+    source_id: UUID
+    # When this data was collected
+    collected_at: datetime = _dc_field(default_factory=_utcnow)
+    # Raw data in plugin-specific format
+    payload: Any
+    # Metadata about collection (response time, errors, etc.)
+    diagnostics: Any = _dc_field(default_factory=dict)
 
 
 class TermStat(BaseModel):
@@ -175,21 +173,17 @@ class TermStat(BaseModel):
         description="The extracted term or phrase"
     )
     weight: float = Field(
-        ge=0.0,
-        le=1.0,
         description="Relative importance/frequency (0-1)"
     )
     polarity: float = Field(
-        ge=-1.0,
-        le=1.0,
         description="Sentiment polarity of this term (-1 to +1)"
     )
     novelty: float = Field(
-        ge=0.0,
-        le=1.0,
         description="How novel/unexpected this term is (0-1)"
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class DistilledSnapshot(BaseModel):
     """
@@ -204,21 +198,16 @@ class DistilledSnapshot(BaseModel):
         description="ID of the source this snapshot belongs to"
     )
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_utcnow,
         description="When this snapshot was created"
     )
     sentiment: float = Field(
-        ge=-1.0,
-        le=1.0,
         description="Overall sentiment score (-1=very negative to +1=very positive)"
     )
     sentiment_confidence: float = Field(
-        ge=0.0,
-        le=1.0,
         description="Confidence in the sentiment measurement (0-1)"
     )
     volatility: float = Field(
-        ge=0.0,
         description="Measure of how much sentiment has changed recently"
     )
     terms: list[TermStat] = Field(
@@ -226,45 +215,54 @@ class DistilledSnapshot(BaseModel):
         description="Extracted terms with statistics (may be empty for numeric sources)"
     )
     term_entropy: float = Field(
-        ge=0.0,
         description="Entropy of term distribution (higher = more diverse)"
     )
     anomaly_score: float = Field(
-        ge=0.0,
-        le=1.0,
         description="How anomalous this snapshot is compared to history (0-1)"
     )
     coverage: float = Field(
-        ge=0.0,
-        le=1.0,
         description="Data quality/completeness metric (0-1)"
     )
-    metadata: dict[str, Any] | None = Field(
+    numeric_value: Optional[float] = Field(
+        default=None,
+        description="Native numeric reading for numeric sources (None for text/event sources)"
+    )
+    metadata: Any = Field(
         default=None,
         description="Plugin-specific metadata for display purposes (e.g., current value, min/max)"
     )
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "source_id": "550e8400-e29b-41d4-a716-446655440000",
-                "timestamp": "2026-01-14T12:00:00Z",
-                "sentiment": 0.35,
-                "sentiment_confidence": 0.8,
-                "volatility": 0.12,
-                "terms": [
-                    {
-                        "term": "market growth",
-                        "weight": 0.8,
-                        "polarity": 0.6,
-                        "novelty": 0.3
-                    }
-                ],
-                "term_entropy": 2.4,
-                "anomaly_score": 0.15,
-                "coverage": 1.0
-            }
+    model_config = ConfigDict(frozen=True, json_schema_extra={
+        "example": {
+            "source_id": "550e8400-e29b-41d4-a716-446655440000",
+            "timestamp": "2026-01-14T12:00:00Z",
+            "sentiment": 0.35,
+            "sentiment_confidence": 0.8,
+            "volatility": 0.12,
+            "terms": [
+                {
+                    "term": "market growth",
+                    "weight": 0.8,
+                    "polarity": 0.6,
+                    "novelty": 0.3
+                }
+            ],
+            "term_entropy": 2.4,
+            "anomaly_score": 0.15,
+            "coverage": 1.0
         }
+    })
+
+    @classmethod
+    def from_json(cls, data: bytes | str) -> "DistilledSnapshot":
+        """
+        Validate a snapshot directly from JSON bytes.
+
+        Routes the payload through pydantic-core's fused parse+validate,
+        skipping the intermediate Python dict a json.loads round-trip
+        would allocate.
+        """
+        return DISTILLED_SNAPSHOT_ADAPTER.validate_json(data)
 
 
 class GlobalSentiment(BaseModel):
@@ -274,7 +272,7 @@ class GlobalSentiment(BaseModel):
     This is computed on-demand from the latest distilled snapshots.
     """
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_utcnow,
         description="When this aggregation was computed"
     )
     global_sentiment: float = Field(
@@ -294,3 +292,14 @@ class GlobalSentiment(BaseModel):
         ge=0.0,
         description="Overall volatility across all sources"
     )
+
+    model_config = ConfigDict(frozen=True)
+
+# Module-level TypeAdapters, constructed once so repeated JSON ingestion
+# reuses the compiled validators
+RAW_SNAPSHOT_ADAPTER: TypeAdapter = TypeAdapter(RawSnapshot)
+DISTILLED_SNAPSHOT_ADAPTER: TypeAdapter = TypeAdapter(DistilledSnapshot)
+TERM_STAT_LIST_ADAPTER: TypeAdapter = TypeAdapter(list[TermStat])
+SNAPSHOT_LIST_ADAPTER: TypeAdapter = TypeAdapter(list[DistilledSnapshot])
+SOURCE_LIST_ADAPTER: TypeAdapter = TypeAdapter(list[SourceInstance])
+PLUGIN_LIST_ADAPTER: TypeAdapter = TypeAdapter(list[PluginDefinition])
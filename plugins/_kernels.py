@@ -0,0 +1,76 @@
+"""
+Numeric kernels for plugin distillation math.
+
+Statistics over history windows (volatility, anomaly z-scores) are the
+hot loops of distill implementations. As with core._kernels, they are
+JIT-compiled with numba when it is installed and fall back to NumPy
+otherwise.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+
+def _mean_std(y: np.ndarray) -> tuple:
+    """
+    Mean and population standard deviation via Welford's algorithm.
+
+    Single pass over the window — each element is read once — and
+    numerically stabler than the naive two-pass sum of squares.
+    """
+    n = y.shape[0]
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        x = y[i]
+        delta = x - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x - mean)
+
+    return mean, (m2 / n) ** 0.5
+
+
+def _mean_std_numpy(y: np.ndarray) -> tuple:
+    """NumPy fallback for the mean/std kernel."""
+    return float(y.mean()), float(y.std())
+
+
+if njit is not None:
+    _mean_std_kernel = njit(cache=True, fastmath=True)(_mean_std)
+else:
+    _mean_std_kernel = _mean_std_numpy
+
+# Below this many elements the NumPy/numba call wrapper costs more than
+# the arithmetic it wraps, so a plain Python loop wins
+_SMALL_WINDOW = 8
+
+
+def mean_std(values) -> tuple:
+    """
+    Mean and population standard deviation of a window.
+
+    Accepts any sized sequence of floats; tiny windows (the common case
+    for young sources) take a pure-Python fast path instead of paying
+    the array-conversion and kernel-dispatch overhead.
+    """
+    n = len(values)
+    if n < _SMALL_WINDOW:
+        # Welford here too: one read per element
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        for x in values:
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+
+        return mean, (m2 / n) ** 0.5
+
+    if not isinstance(values, np.ndarray):
+        values = np.fromiter(values, dtype=np.float64, count=n)
+    return _mean_std_kernel(values)
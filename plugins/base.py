@@ -6,7 +6,7 @@ with the core tracking system.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import ClassVar, Optional
 
 from core.schemas import (
     DistilledSnapshot,
@@ -28,15 +28,45 @@ class PluginBase(ABC):
     Each plugin class represents a TYPE of data source (e.g., "numeric_index").
     Individual SourceInstances provide the configuration for specific instances.
     """
-    
+
+    # Definition memoized per plugin class; populated on first access
+    _cached_definition: ClassVar[Optional[PluginDefinition]] = None
+
+    # Required config fields from the schema, frozen per class alongside
+    # the cached definition
+    _required_fields: ClassVar[Optional[frozenset[str]]] = None
+
+    def get_definition_cached(self) -> PluginDefinition:
+        """
+        Return the plugin definition, building it at most once per class.
+
+        get_definition() constructs a fresh PluginDefinition (a pydantic
+        model with a nested schema dict) each call; hot paths like
+        validate_config should use this cached accessor instead.
+
+        Returns:
+            The memoized PluginDefinition
+        """
+        cls = type(self)
+        # Check the subclass's own dict so plugins don't share a parent's cache
+        if cls.__dict__.get("_cached_definition") is None:
+            definition = self.get_definition()
+            cls._cached_definition = definition
+            cls._required_fields = frozenset(
+                definition.config_schema.get("required", ())
+            )
+        return cls._cached_definition
+
+    @classmethod
     @abstractmethod
-    def get_definition(self) -> PluginDefinition:
+    def get_definition(cls) -> PluginDefinition:
         """
         Return the plugin definition metadata.
-        
+
         This defines the plugin's identity, capabilities, and configuration schema.
-        Called once at plugin registration.
-        
+        Called once at plugin registration. A classmethod so registration
+        and discovery never have to instantiate the plugin to read it.
+
         Returns:
             PluginDefinition with complete metadata
         """
@@ -95,6 +125,27 @@ class PluginBase(ABC):
         """
         pass
     
+    @staticmethod
+    def build_raw(**fields) -> RawSnapshot:
+        """
+        Construct a RawSnapshot from trusted plugin data.
+
+        RawSnapshot is a plain dataclass, so this is just its keyword
+        constructor — the plugin built every value itself and no
+        validation runs. Callers must pass correctly-typed values.
+        """
+        return RawSnapshot(**fields)
+
+    @staticmethod
+    def build_distilled(**fields) -> DistilledSnapshot:
+        """
+        Construct a DistilledSnapshot from trusted plugin data.
+
+        Skips pydantic validation via model_construct; bounds are
+        enforced once at the storage write boundary instead.
+        """
+        return DistilledSnapshot.model_construct(**fields)
+
     async def healthcheck(self, instance: SourceInstance) -> tuple[bool, str]:
         """
         Check if the source is healthy and accessible.
@@ -129,13 +180,13 @@ class PluginBase(ABC):
         Returns:
             Tuple of (is_valid, error_message)
         """
-        definition = self.get_definition()
-        schema = definition.config_schema
-        
-        # Basic validation: check required fields
-        if "required" in schema:
-            for field in schema["required"]:
-                if field not in config:
-                    return False, f"Missing required field: {field}"
-        
+        # Ensure the per-class required-field set is populated
+        self.get_definition_cached()
+
+        # Basic validation: single C-level set difference instead of
+        # per-field membership checks
+        missing = type(self)._required_fields - config.keys()
+        if missing:
+            return False, f"Missing required field: {', '.join(sorted(missing))}"
+
         return True, "Configuration is valid"
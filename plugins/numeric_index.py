@@ -5,22 +5,154 @@ Tracks a single numeric value from a URL and determines sentiment
 based on whether the value increased or decreased from a baseline.
 """
 
-import math
-from datetime import datetime, timedelta
-from typing import Any
+import functools
+import time
+from enum import IntEnum
+from typing import Any, ClassVar, Optional
+from uuid import UUID
 
 import httpx
+import numpy as np
+import orjson
 
 from core.schemas import (
     DistilledSnapshot,
     PluginDefinition,
     RawSnapshot,
-    SourceCategory,
     SourceInstance,
     TermStat,
+    _utcnow,
 )
+from plugins._kernels import mean_std
 from plugins.base import PluginBase
 
+# Slots in each per-source sentiment ring buffer; matches the widest
+# window the stats use (anomaly looks at the last 20 snapshots)
+_SENT_WINDOW = 20
+
+
+class _Mode(IntEnum):
+    """Sentiment calculation modes, resolved once per distill."""
+    CHANGE = 0
+    HIGHER = 1
+    LOWER = 2
+    TARGET = 3
+
+
+# Config string -> mode id; unknown strings fall through to the
+# neutral branch just as before
+_MODE_IDS = {
+    "change_tracking": _Mode.CHANGE,
+    "higher_is_better": _Mode.HIGHER,
+    "lower_is_better": _Mode.LOWER,
+    "target_is_best": _Mode.TARGET,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _range_constants(
+    min_value: float,
+    max_value: float,
+    midpoint: float
+) -> tuple[float, float, float]:
+    """
+    Derived constants for range-based sentiment, computed once per range.
+
+    Keyed on the range values themselves, so a source whose config is
+    edited simply misses into a fresh entry — no staleness.
+
+    Returns:
+        Tuple of (upper_span, lower_span, max_distance)
+    """
+    upper_span = max_value - midpoint
+    lower_span = midpoint - min_value
+    max_distance = max(abs(upper_span), abs(lower_span))
+    return upper_span, lower_span, max_distance
+
+
+def _range_confidence(d: float, max_distance: float) -> float:
+    """
+    Confidence grows from 0.5 at the midpoint toward 1 at the extremes.
+
+    A collapsed range (min == max == midpoint) has no distance scale,
+    so it pins confidence at the neutral 0.5 rather than dividing by
+    zero.
+    """
+    if max_distance == 0.0:
+        return 0.5
+    return min(1.0, 0.5 + (abs(d) / max_distance) * 0.5)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_path(path: str) -> tuple[tuple[str, tuple[int, ...]], ...]:
+    """
+    Tokenize a dot/bracket JSON path into (key, indices) segments.
+
+    One character scan over the whole string — no regex engine.
+    "daily.temps[0][1]" -> (("daily", ()), ("temps", (0, 1))).
+
+    A source's json_path is static config, so results are memoized:
+    after the first collect, navigation reuses the parsed segments
+    without rescanning the string. Tuples (not lists) so entries are
+    hashable and safely shared between cache hits.
+
+    Args:
+        path: Dot-notation path with optional array indices
+
+    Returns:
+        Tuple of (key, indices) pairs, in path order
+
+    Raises:
+        ValueError: If a bracket is unclosed or an index is not an integer
+    """
+    segments = []
+    name_chars: list[str] = []
+    indices: list[int] = []
+    i = 0
+    n = len(path)
+
+    while i < n:
+        ch = path[i]
+        if ch == ".":
+            segments.append(("".join(name_chars), tuple(indices)))
+            name_chars = []
+            indices = []
+            i += 1
+        elif ch == "[":
+            close = path.index("]", i)
+            indices.append(int(path[i + 1:close]))
+            i = close + 1
+        else:
+            name_chars.append(ch)
+            i += 1
+
+    segments.append(("".join(name_chars), tuple(indices)))
+    return tuple(segments)
+
+
+# Recent successful readings keyed by (url, json_path) with a monotonic
+# expiry. Endpoints polled faster than they publish (tickers on a
+# per-minute schedule against an hourly feed) answer from here without
+# an HTTP round trip. One small tuple per distinct endpoint, so no
+# eviction machinery is needed.
+_COLLECT_CACHE_TTL = 30.0
+_collect_cache: dict[tuple[str, Optional[str]], tuple[float, float]] = {}
+
+# Shared across all numeric-index sources. Keep-alive pooling means
+# repeated polls of the same host skip the TCP+TLS handshake that
+# dominated per-collect latency with a fresh client each call.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        )
+    return _client
+
 
 class NumericIndexPlugin(PluginBase):
     """
@@ -31,8 +163,55 @@ class NumericIndexPlugin(PluginBase):
     - baseline: Optional baseline value for comparison (defaults to first reading)
     - json_path: Optional JSON path if response is JSON (e.g., "data.value")
     """
-    
-    def get_definition(self) -> PluginDefinition:
+
+    # Per-source ring buffers of recent sentiments: a fixed float64
+    # buffer plus [write_index, filled_count], seeded from history on
+    # first sight of a source and then appended in O(1) per distill —
+    # no per-call list slicing or attribute walks for the stats window
+    _sent_rings: ClassVar[dict[UUID, list]] = {}
+
+    # Running (observed_min, observed_max) per source; seeded from
+    # history once, then folded forward in O(1) per distill
+    _obs_stats: ClassVar[dict[UUID, tuple[float, float]]] = {}
+
+    def _history_window(
+        self,
+        source_id: UUID,
+        history: list[DistilledSnapshot]
+    ) -> np.ndarray:
+        """
+        Return the recent sentiment series for a source, oldest first.
+
+        Reads from the per-source ring buffer, seeding it from the
+        given history the first time a source is seen (e.g. after a
+        restart).
+        """
+        ring = self._sent_rings.get(source_id)
+        if ring is None:
+            buf = np.zeros(_SENT_WINDOW, dtype=np.float64)
+            recent = history[-_SENT_WINDOW:]
+            for i, snapshot in enumerate(recent):
+                buf[i] = snapshot.sentiment
+            count = len(recent)
+            ring = [buf, count % _SENT_WINDOW, count]
+            self._sent_rings[source_id] = ring
+
+        buf, idx, count = ring
+        if count < _SENT_WINDOW:
+            return buf[:count]
+        # Full buffer: unroll so the array reads chronologically
+        return np.concatenate((buf[idx:], buf[:idx]))
+
+    def _push_sentiment(self, source_id: UUID, sentiment: float) -> None:
+        """Append a freshly distilled sentiment to the source's ring."""
+        ring = self._sent_rings[source_id]
+        buf, idx, count = ring
+        buf[idx] = sentiment
+        ring[1] = (idx + 1) % _SENT_WINDOW
+        ring[2] = min(count + 1, _SENT_WINDOW)
+
+    @classmethod
+    def get_definition(cls) -> PluginDefinition:
         """Return plugin definition."""
         return PluginDefinition(
             plugin_id="numeric_index",
@@ -42,7 +221,7 @@ class NumericIndexPlugin(PluginBase):
                 "Tracks a single numeric value from a URL. "
                 "Calculates sentiment based on configurable range and polarity modes."
             ),
-            source_category=SourceCategory.NUMERIC,
+            source_category="NUMERIC",
             config_schema={
                 "type": "object",
                 "properties": {
@@ -60,6 +239,11 @@ class NumericIndexPlugin(PluginBase):
                         "default": 10,
                         "description": "Request timeout in seconds"
                     },
+                    "cache_ttl": {
+                        "type": "number",
+                        "default": 30,
+                        "description": "Seconds to reuse a fetched value before re-requesting (0 disables)"
+                    },
                     "mode": {
                         "type": "string",
                         "enum": ["higher_is_better", "lower_is_better", "target_is_best", "change_tracking"],
@@ -92,58 +276,104 @@ class NumericIndexPlugin(PluginBase):
         url = instance.config["url"]
         timeout = instance.config.get("timeout", 10)
         json_path = instance.config.get("json_path")
-        
-        start_time = datetime.utcnow()
-        
+        cache_ttl = instance.config.get("cache_ttl", _COLLECT_CACHE_TTL)
+
+        # Fresh-enough reading for this endpoint? Skip the fetch.
+        cache_key = (url, json_path)
+        if cache_ttl:
+            hit = _collect_cache.get(cache_key)
+            if hit is not None and hit[0] > time.monotonic():
+                return self.build_raw(
+                    source_id=instance.source_id,
+                    collected_at=_utcnow(),
+                    payload={"value": hit[1]},
+                    diagnostics={"response_time_ms": 0.0, "cached": True}
+                )
+
+        t0 = time.perf_counter_ns()
+
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, timeout=timeout)
-                response.raise_for_status()
-                
-                # Try to parse as JSON first
+            client = _get_client()
+            response = await client.get(url, timeout=timeout)
+            response.raise_for_status()
+
+            # Dispatch on Content-Type so the common case parses the
+            # right representation first time, with no raised-and-caught
+            # exception per plaintext response. Mislabelled bodies still
+            # get one shot at the other representation.
+            content_type = response.headers.get("content-type", "")
+            try:
+                if "json" in content_type:
+                    value = self._value_from_json(orjson.loads(response.content), json_path)
+                else:
+                    # float() accepts bytes and skips surrounding
+                    # whitespace, so the body is never decoded to str
+                    value = float(response.content)
+            except (ValueError, KeyError):
                 try:
-                    data = response.json()
-                    
-                    # Extract value from JSON path if specified
-                    if json_path:
-                        value = self._extract_json_path(data, json_path)
+                    if "json" in content_type:
+                        value = float(response.content)
                     else:
-                        # If no path, assume the response is a single number or has a 'value' field
-                        if isinstance(data, (int, float)):
-                            value = float(data)
-                        elif isinstance(data, dict) and 'value' in data:
-                            value = float(data['value'])
-                        else:
-                            raise ValueError("Cannot determine numeric value from JSON response")
-                    
-                except (ValueError, KeyError) as e:
-                    # Not JSON, try to parse as plaintext number
-                    text = response.text.strip()
-                    try:
-                        value = float(text)
-                    except ValueError:
-                        raise ValueError(f"Cannot parse response as number: {text[:100]}")
-                
-                end_time = datetime.utcnow()
-                
-                return RawSnapshot(
-                    source_id=instance.source_id,
-                    collected_at=datetime.utcnow(),
-                    payload={"value": value},
-                    diagnostics={
-                        "response_time_ms": (end_time - start_time).total_seconds() * 1000,
-                        "status_code": response.status_code,
-                        "content_type": response.headers.get("content-type", "unknown")
-                    }
-                )
-        
-        except httpx.TimeoutException:
-            raise Exception(f"Request to {url} timed out after {timeout}s")
+                        value = self._value_from_json(orjson.loads(response.content), json_path)
+                except (ValueError, KeyError):
+                    raise ValueError(
+                        f"Cannot parse response as number: {response.text.strip()[:100]}"
+                    )
+
+            if cache_ttl:
+                _collect_cache[cache_key] = (time.monotonic() + cache_ttl, value)
+
+            # Monotonic elapsed time; one wall-clock read just for the
+            # collected_at timestamp
+            elapsed_ms = (time.perf_counter_ns() - t0) / 1e6
+
+            return self.build_raw(
+                source_id=instance.source_id,
+                collected_at=_utcnow(),
+                payload={"value": value},
+                diagnostics={
+                    "response_time_ms": elapsed_ms,
+                    "status_code": response.status_code,
+                    "content_type": response.headers.get("content-type", "unknown")
+                }
+            )
+
+        except httpx.TimeoutException as e:
+            raise RuntimeError(f"Request to {url} timed out after {timeout}s") from e
         except httpx.HTTPError as e:
-            raise Exception(f"HTTP error fetching {url}: {e}")
-        except Exception as e:
-            raise Exception(f"Failed to collect data: {e}")
+            raise RuntimeError(f"HTTP error fetching {url}: {e}") from e
     
+    def _value_from_json(self, data: Any, json_path: Optional[str]) -> float:
+        """
+        Pull the numeric value out of a decoded JSON body.
+
+        Args:
+            data: Decoded JSON structure
+            json_path: Optional dot-notation path into the structure
+
+        Returns:
+            Extracted numeric value
+
+        Raises:
+            ValueError: If no numeric value can be determined
+            KeyError: If the path does not exist in the structure
+        """
+        if json_path:
+            return self._extract_json_path(data, json_path)
+        # No path: bare numbers (and strings encoding numbers) convert
+        # in one float() call, skipping the isinstance ladder
+        try:
+            return float(data)
+        except (TypeError, ValueError):
+            pass
+        # Otherwise look for a 'value' field — get() is one hash lookup
+        # instead of a membership test plus a subscript
+        if isinstance(data, dict):
+            value = data.get('value')
+            if value is not None:
+                return float(value)
+        raise ValueError("Cannot determine numeric value from JSON response")
+
     def _extract_json_path(self, data: Any, path: str) -> float:
         """
         Extract value from nested JSON using dot notation and array indices.
@@ -160,43 +390,33 @@ class NumericIndexPlugin(PluginBase):
         Returns:
             Extracted numeric value
         """
-        import re
-
-        # Split path by dots, but handle array indices
-        parts = path.split(".")
         current = data
-        
-        for part in parts:
-            # Check if this part has array index notation: name[index]
-            match = re.match(r'([^\[]+)(\[\d+\])+$', part)
-            
-            if match:
-                # Extract name and all indices
-                name = match.group(1)
-                indices_str = match.group(2)
-                
-                # Navigate to the named field first
-                if isinstance(current, dict) and name:
+
+        # Most configured paths are pure dotted names ("data.value");
+        # walk those directly off a split, without tokenizing brackets
+        if "[" not in path:
+            for name in path.split("."):
+                if not isinstance(current, dict):
+                    raise KeyError(f"Cannot navigate path '{path}' - not a dict at '{name}'")
+                current = current[name]
+            return float(current)
+
+        for name, indices in _parse_path(path):
+            # Navigate to the named field first (empty name means the
+            # segment was pure indices, e.g. "[0]")
+            if name:
+                if isinstance(current, dict):
                     current = current[name]
-                elif not name:  # Just indices, no name
-                    pass
                 else:
-                    raise KeyError(f"Cannot navigate path '{path}' - not a dict at '{part}'")
-                
-                # Process all array indices [0][1][2] etc.
-                for index_match in re.finditer(r'\[(\d+)\]', indices_str):
-                    index = int(index_match.group(1))
-                    if isinstance(current, list):
-                        current = current[index]
-                    else:
-                        raise KeyError(f"Cannot navigate path '{path}' - not a list at index {index}")
-            else:
-                # Simple dict navigation
-                if isinstance(current, dict):
-                    current = current[part]
+                    raise KeyError(f"Cannot navigate path '{path}' - not a dict at '{name}'")
+
+            # Then apply array indices [0][1][2] etc.
+            for index in indices:
+                if isinstance(current, list):
+                    current = current[index]
                 else:
-                    raise KeyError(f"Cannot navigate path '{path}' - not a dict at '{part}'")
-        
+                    raise KeyError(f"Cannot navigate path '{path}' - not a list at index {index}")
+
         return float(current)
     
     async def distill(
@@ -217,7 +437,8 @@ class NumericIndexPlugin(PluginBase):
         current_value = raw.payload["value"]
         config = instance.config
         mode = config.get("mode", "change_tracking")
-        
+        mode_id = _MODE_IDS.get(mode)
+
         # Get previous value for reference
         previous_value = None
         baseline = None
@@ -227,14 +448,14 @@ class NumericIndexPlugin(PluginBase):
                 baseline = self._extract_value_from_history(history[0])
         
         # Calculate sentiment based on mode
-        if mode == "change_tracking":
+        if mode_id is _Mode.CHANGE:
             sentiment, confidence = self._calculate_change_sentiment(current_value, previous_value)
         else:
             # Range-based modes
             min_value = config.get("min_value")
             max_value = config.get("max_value")
             midpoint = config.get("midpoint")
-            
+
             if min_value is None or max_value is None:
                 # Fallback to change tracking if range not configured
                 sentiment, confidence = self._calculate_change_sentiment(current_value, previous_value)
@@ -242,37 +463,46 @@ class NumericIndexPlugin(PluginBase):
                 # Calculate midpoint if not specified
                 if midpoint is None:
                     midpoint = (min_value + max_value) / 2
-                
+
                 sentiment, confidence = self._calculate_range_sentiment(
-                    current_value, min_value, max_value, midpoint, mode
+                    current_value, min_value, max_value, midpoint, mode_id
                 )
         
+        # Recent sentiments come from the per-source ring buffer — a
+        # contiguous float64 window maintained in O(1) per distill;
+        # both the volatility and anomaly kernels slice from it
+        sentiments = self._history_window(raw.source_id, history)
+
         # Calculate volatility from recent history
-        volatility = self._calculate_volatility(history, current_value)
-        
+        volatility = self._calculate_volatility(sentiments)
+
         # Calculate anomaly score
-        anomaly_score = self._calculate_anomaly(history, current_value)
-        
-        # Store the numeric value in terms array for future reference
-        # Encode as string in the term field
-        terms = [
-            TermStat(
-                term=f"value:{current_value}",  # Store value in the term name
-                weight=1.0,
-                polarity=0.0,  # Neutral polarity for numeric values
-                novelty=0.0
-            )
-        ]
-        
-        # Calculate min/max from history
-        all_values = [current_value]
-        if history:
-            all_values.extend([
-                self._extract_value_from_history(s) for s in history
-            ])
-        
-        observed_min = min(all_values)
-        observed_max = max(all_values)
+        anomaly_score = self._calculate_anomaly(sentiments)
+
+        # Record this cycle's sentiment for the next distill's window
+        self._push_sentiment(raw.source_id, sentiment)
+        
+        # The reading travels in the typed numeric_value field (and
+        # metadata); no term entry needed. Readers still understand the
+        # legacy "value:..." encoding on old rows via
+        # _extract_value_from_history.
+        terms: list[TermStat] = []
+
+
+        # Fold the current reading into the running observed min/max;
+        # history is only scanned once per source to seed the pair
+        stats = self._obs_stats.get(raw.source_id)
+        if stats is None:
+            if history:
+                hist_values = [self._extract_value_from_history(s) for s in history]
+                observed_min = min(current_value, min(hist_values))
+                observed_max = max(current_value, max(hist_values))
+            else:
+                observed_min = observed_max = current_value
+        else:
+            observed_min = min(stats[0], current_value)
+            observed_max = max(stats[1], current_value)
+        self._obs_stats[raw.source_id] = (observed_min, observed_max)
         
         # Build metadata for display
         metadata = {
@@ -291,7 +521,7 @@ class NumericIndexPlugin(PluginBase):
             metadata["configured_max"] = config.get("max_value")
             metadata["configured_midpoint"] = config.get("midpoint")
         
-        return DistilledSnapshot(
+        return self.build_distilled(
             source_id=raw.source_id,
             timestamp=raw.collected_at,
             sentiment=sentiment,
@@ -301,6 +531,7 @@ class NumericIndexPlugin(PluginBase):
             term_entropy=0.0,
             anomaly_score=anomaly_score,
             coverage=1.0,
+            numeric_value=current_value,
             metadata=metadata
         )
     
@@ -335,7 +566,7 @@ class NumericIndexPlugin(PluginBase):
         min_value: float,
         max_value: float,
         midpoint: float,
-        mode: str
+        mode_id: int
     ) -> tuple[float, float]:
         """
         Calculate sentiment based on position within a range.
@@ -345,68 +576,64 @@ class NumericIndexPlugin(PluginBase):
             min_value: Minimum of range
             max_value: Maximum of range
             midpoint: Neutral/target value
-            mode: 'higher_is_better', 'lower_is_better', or 'target_is_best'
+            mode_id: _Mode.HIGHER, _Mode.LOWER, or _Mode.TARGET
         
         Returns:
             Tuple of (sentiment, confidence)
         """
-        if mode == "higher_is_better":
-            # At or above max: sentiment = 1
-            # At midpoint: sentiment = 0
-            # At or below min: sentiment = -1
-            if value >= max_value:
-                sentiment = 1.0
-            elif value <= min_value:
-                sentiment = -1.0
-            elif value >= midpoint:
-                # Scale from 0 to 1
-                sentiment = (value - midpoint) / (max_value - midpoint)
+        # Spans and max distance are invariant per configured range;
+        # fetch the cached constants instead of rederiving them in
+        # every branch below
+        upper_span, lower_span, range_max_distance = _range_constants(
+            min_value, max_value, midpoint
+        )
+
+        if mode_id is _Mode.HIGHER:
+            # Scales linearly from -1 at/below min through 0 at the
+            # midpoint to +1 at/above max. The clamp subsumes the old
+            # four-way branch chain: past-the-extreme values divide to
+            # |ratio| >= 1 and saturate. A midpoint configured at the
+            # range edge makes the relevant span zero; every value on
+            # that side sits at or past the extreme, so saturate
+            # outright instead of dividing.
+            d = value - midpoint
+            span = upper_span if d >= 0.0 else lower_span
+            if span == 0.0:
+                sentiment = 1.0 if d >= 0.0 else -1.0
             else:
-                # Scale from -1 to 0
-                sentiment = (value - midpoint) / (midpoint - min_value)
-            
+                sentiment = max(-1.0, min(1.0, d / span))
+
             # High confidence when near extremes
-            distance_from_mid = abs(value - midpoint)
-            max_distance = max(abs(max_value - midpoint), abs(min_value - midpoint))
-            confidence = min(1.0, 0.5 + (distance_from_mid / max_distance) * 0.5)
-        
-        elif mode == "lower_is_better":
-            # Inverse of higher_is_better
-            # At or below min: sentiment = 1
-            # At midpoint: sentiment = 0
-            # At or above max: sentiment = -1
-            if value <= min_value:
-                sentiment = 1.0
-            elif value >= max_value:
-                sentiment = -1.0
-            elif value <= midpoint:
-                # Scale from 1 to 0
-                sentiment = (midpoint - value) / (midpoint - min_value)
+            confidence = _range_confidence(d, range_max_distance)
+
+        elif mode_id is _Mode.LOWER:
+            # Inverse of higher_is_better: +1 at/below min, -1 at/above max
+            d = value - midpoint
+            span = lower_span if d <= 0.0 else upper_span
+            if span == 0.0:
+                sentiment = 1.0 if d <= 0.0 else -1.0
             else:
-                # Scale from 0 to -1
-                sentiment = -(value - midpoint) / (max_value - midpoint)
-            
-            distance_from_mid = abs(value - midpoint)
-            max_distance = max(abs(max_value - midpoint), abs(min_value - midpoint))
-            confidence = min(1.0, 0.5 + (distance_from_mid / max_distance) * 0.5)
-        
-        elif mode == "target_is_best":
+                sentiment = max(-1.0, min(1.0, -d / span))
+
+            confidence = _range_confidence(d, range_max_distance)
+
+        elif mode_id is _Mode.TARGET:
             # Being at midpoint is ideal (sentiment = 1)
             # Being at either extreme is bad (sentiment = -1)
             distance_from_target = abs(value - midpoint)
-            
+
             if value >= midpoint:
-                max_distance = max_value - midpoint
+                max_distance = upper_span
             else:
-                max_distance = midpoint - min_value
-            
+                max_distance = lower_span
+
             # Clamp value to range
             if value > max_value:
-                distance_from_target = abs(max_value - midpoint)
-                max_distance = max_value - midpoint
+                distance_from_target = abs(upper_span)
+                max_distance = upper_span
             elif value < min_value:
-                distance_from_target = abs(min_value - midpoint)
-                max_distance = midpoint - min_value
+                distance_from_target = abs(lower_span)
+                max_distance = lower_span
             
             # Sentiment decreases as we move away from target
             if max_distance > 0:
@@ -433,76 +660,80 @@ class NumericIndexPlugin(PluginBase):
     def _extract_value_from_history(self, snapshot: DistilledSnapshot) -> float:
         """
         Extract numeric value from a historical snapshot.
-        
-        The value is stored in the terms array with format "value:123.45"
-        
+
+        Current snapshots carry the reading in the typed numeric_value
+        field; slightly older ones only have metadata["current_value"];
+        the oldest encoded it in the terms array as "value:123.45".
+        Checked in that order.
+
         Args:
             snapshot: Historical distilled snapshot
-            
+
         Returns:
             The numeric value from that snapshot
         """
-        # Look for the value: term
+        if snapshot.numeric_value is not None:
+            return snapshot.numeric_value
+
+        metadata = snapshot.metadata
+        if metadata is not None:
+            value = metadata.get("current_value")
+            if value is not None:
+                return value
+
+        # Legacy fallback: parse the value: term
         for term in snapshot.terms:
             if term.term.startswith("value:"):
                 try:
                     return float(term.term.split(":", 1)[1])
                 except (ValueError, IndexError):
                     pass
-        
+
         # Fallback if not found (for old snapshots)
         return 0.0
     
-    def _calculate_volatility(
-        self,
-        history: list[DistilledSnapshot],
-        current_value: float
-    ) -> float:
+    def _calculate_volatility(self, sentiments) -> float:
         """
         Calculate volatility based on recent fluctuations.
-        
+
         Uses standard deviation of recent sentiment changes.
         """
-        if len(history) < 2:
+        if len(sentiments) < 2:
             return 0.0
-        
+
+        window = sentiments[-10:]  # Last 10 snapshots
+        # Flat windows — cold starts and stable indices — are common;
+        # one vectorized comparison skips the whole Welford pass
+        if (window == window[0]).all():
+            return 0.0
+
         # Use sentiment changes as proxy for value changes
-        recent = history[-10:]  # Last 10 snapshots
-        sentiments = [s.sentiment for s in recent]
-        
-        # Calculate standard deviation
-        mean = sum(sentiments) / len(sentiments)
-        variance = sum((s - mean) ** 2 for s in sentiments) / len(sentiments)
-        std_dev = math.sqrt(variance)
-        
+        _, std_dev = mean_std(window)
+
         return min(1.0, std_dev * 2)  # Scale to 0-1 range
-    
-    def _calculate_anomaly(
-        self,
-        history: list[DistilledSnapshot],
-        current_value: float
-    ) -> float:
+
+    def _calculate_anomaly(self, sentiments) -> float:
         """
         Calculate how anomalous the current value is.
-        
+
         Based on z-score from recent history.
         """
-        if len(history) < 3:
+        if len(sentiments) < 3:
             return 0.0
-        
-        recent = history[-20:]  # Last 20 snapshots
-        sentiments = [s.sentiment for s in recent]
-        
-        mean = sum(sentiments) / len(sentiments)
-        variance = sum((s - mean) ** 2 for s in sentiments) / len(sentiments)
-        std_dev = math.sqrt(variance)
-        
+
+        recent = sentiments[-20:]  # Last 20 snapshots
+        # A uniform window would hit the std_dev == 0 guard below
+        # anyway; bail before paying for the mean/std pass
+        if (recent == recent[0]).all():
+            return 0.0
+
+        mean, std_dev = mean_std(recent)
+
         if std_dev == 0:
             return 0.0
-        
+
         # Current sentiment vs historical
-        current_sentiment = sentiments[-1] if sentiments else 0
-        z_score = abs(current_sentiment - mean) / std_dev
-        
+        z_score = abs(recent[-1] - mean) / std_dev
+
         # Convert z-score to 0-1 range (z > 3 is very anomalous)
         return min(1.0, z_score / 3)
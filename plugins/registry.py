@@ -5,7 +5,6 @@ Manages discovery, registration, and retrieval of plugins.
 """
 
 import importlib
-import inspect
 import pkgutil
 from pathlib import Path
 from typing import Optional
@@ -21,49 +20,61 @@ class PluginRegistry:
     Plugins are discovered at startup by scanning the plugins directory.
     The registry provides lookup and instantiation services.
     """
-    
+
+    # Fixed attribute set: no per-registry __dict__, and attribute reads
+    # on the hot lookup paths resolve through slot descriptors
+    __slots__ = ("_plugins", "_definitions", "_instances")
+
     def __init__(self):
         self._plugins: dict[str, type[PluginBase]] = {}
         self._definitions: dict[str, PluginDefinition] = {}
-    
+        self._instances: dict[str, PluginBase] = {}
+
     def register(self, plugin_class: type[PluginBase]) -> None:
         """
         Register a plugin class.
-        
+
         Args:
             plugin_class: A class that inherits from PluginBase
-            
+
         Raises:
             ValueError: If plugin_id is already registered
         """
-        # Instantiate to get definition
-        instance = plugin_class()
-        definition = instance.get_definition()
-        
+        # get_definition is a classmethod, so registration reads the
+        # definition without constructing the plugin; instantiation is
+        # deferred to the first get_plugin call
+        definition = plugin_class.get_definition()
+
         if definition.plugin_id in self._plugins:
             raise ValueError(
                 f"Plugin '{definition.plugin_id}' is already registered"
             )
-        
+
         self._plugins[definition.plugin_id] = plugin_class
         self._definitions[definition.plugin_id] = definition
-        
+
         print(f"Registered plugin: {definition.display_name} ({definition.plugin_id})")
-    
+
     def get_plugin(self, plugin_id: str) -> Optional[PluginBase]:
         """
-        Get an instance of a plugin by ID.
-        
+        Get the shared instance of a plugin by ID.
+
+        Plugins hold no per-source state, so one instance per plugin_id
+        is built on first request and reused thereafter.
+
         Args:
             plugin_id: The unique plugin identifier
-            
+
         Returns:
-            New instance of the plugin, or None if not found
+            The plugin instance, or None if not found
         """
-        plugin_class = self._plugins.get(plugin_id)
-        if plugin_class:
-            return plugin_class()
-        return None
+        instance = self._instances.get(plugin_id)
+        if instance is None:
+            plugin_class = self._plugins.get(plugin_id)
+            if plugin_class is None:
+                return None
+            instance = self._instances[plugin_id] = plugin_class()
+        return instance
     
     def get_definition(self, plugin_id: str) -> Optional[PluginDefinition]:
         """
@@ -106,10 +117,13 @@ class PluginRegistry:
                 # Import the module
                 module = importlib.import_module(f'plugins.{modname}')
                 
-                # Find all PluginBase subclasses
-                for name, obj in inspect.getmembers(module, inspect.isclass):
+                # Find all PluginBase subclasses. Iterating the module
+                # dict directly skips the per-attribute getattr and
+                # sorting that inspect.getmembers would do.
+                for name, obj in vars(module).items():
                     # Check if it's a PluginBase subclass (but not PluginBase itself)
-                    if (issubclass(obj, PluginBase) and 
+                    if (isinstance(obj, type) and
+                        issubclass(obj, PluginBase) and
                         obj is not PluginBase and
                         obj.__module__ == module.__name__):
                         try:
@@ -4,28 +4,52 @@ Web interface for Parallax Index.
 FastAPI routes for the dashboard and source management.
 """
 
+import asyncio
+import time
 from contextlib import asynccontextmanager
 from uuid import UUID
 
-from fastapi import FastAPI, Form, HTTPException, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.staticfiles import StaticFiles
+import orjson
+from fastapi import Depends, FastAPI, Form, HTTPException, Request, Response
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 
 from core.aggregation import AggregationEngine
 from core.api_preview import extract_all_paths, preview_api_endpoint
 from core.schedule_helpers import cron_to_human
 from core.scheduler import CollectionScheduler
-from core.schemas import SentimentPolarity, SourceInstance
+from core.schemas import (
+    PLUGIN_LIST_ADAPTER,
+    SENTIMENT_POLARITIES,
+    SourceInstance,
+)
 from plugins.registry import get_registry
 from storage.database import Database
 
+# The registry is a process-wide singleton; bind it once instead of
+# re-fetching it inside every handler
+registry = get_registry()
+
 # Global instances (initialized in lifespan or main.py)
 db: Database = None
 scheduler: CollectionScheduler = None
 aggregator: AggregationEngine = None
 
 
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Serializes the datetime/UUID/float-heavy API payloads natively in C
+    instead of through stdlib json's Python callbacks. (FastAPI's own
+    ORJSONResponse is deprecated, hence the local class.)
+    """
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -43,7 +67,6 @@ async def lifespan(app: FastAPI):
         await db.initialize()
         
         # Initialize plugin registry
-        registry = get_registry()
         registry.discover_plugins()
         
         # Initialize aggregation engine
@@ -59,7 +82,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     if scheduler:
-        scheduler.stop()
+        await scheduler.stop()
 
 
 # Initialize FastAPI app with lifespan
@@ -67,11 +90,17 @@ app = FastAPI(
     title="Parallax Index",
     description="Global Sentiment & Cultural Drift Tracker",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# Templates
+# Templates. They are static in production, so the per-render mtime
+# stat is disabled and every template is compiled up front — no handler
+# pays disk I/O plus parse latency on its first hit
 templates = Jinja2Templates(directory="web/templates")
+templates.env.auto_reload = False
+for _name in templates.env.list_templates():
+    templates.env.get_template(_name)
 
 # Global instances (initialized in main.py)
 db: Database = None
@@ -87,35 +116,68 @@ def init_web(database: Database, sched: CollectionScheduler, agg: AggregationEng
     aggregator = agg
 
 
+# Dashboard data cache: snapshots only change on the scheduler's
+# cadence, so a burst of page loads can share one computation. The lock
+# single-flights recomputation — concurrent misses wait for the first
+# request's pass rather than each hitting the database.
+_DASHBOARD_TTL = 5.0
+_dashboard_cache: tuple[float, dict] | None = None
+_dashboard_lock = asyncio.Lock()
+
+
+async def _dashboard_data() -> dict:
+    """Compute (or reuse) the dashboard's template context data."""
+    global _dashboard_cache
+
+    cached = _dashboard_cache
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    async with _dashboard_lock:
+        cached = _dashboard_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        # Three fixed queries total: sources, their latest snapshots,
+        # and the batched trend windows. Global sentiment is derived
+        # from the first two instead of issuing its own fetches.
+        sources = await db.list_sources()
+        latest_map = await db.get_latest_snapshots_for(
+            [source.source_id for source in sources]
+        )
+        trends = await aggregator.get_sentiment_trends()
+
+        global_sentiment = aggregator.aggregate_latest([
+            (source, latest_map[source.source_id])
+            for source in sources
+            if source.enabled and source.source_id in latest_map
+        ])
+
+        data = {
+            "global_sentiment": global_sentiment,
+            "sources": [
+                {
+                    "source": source,
+                    "latest": latest_map.get(source.source_id),
+                    "trend": trends.get(source.source_id)
+                }
+                for source in sources
+            ]
+        }
+        _dashboard_cache = (time.monotonic() + _DASHBOARD_TTL, data)
+        return data
+
+
 @app.get("/", response_class=HTMLResponse)
 async def dashboard(request: Request):
     """
     Main dashboard showing global sentiment and source overview.
     """
-    # Get global sentiment
-    global_sentiment = await aggregator.compute_global_sentiment()
-    
-    # Get all sources with their latest snapshots
-    sources = await db.list_sources()
-    source_data = []
-    
-    for source in sources:
-        latest = await db.get_latest_snapshot(source.source_id)
-        trend = await aggregator.get_sentiment_trend(source.source_id)
-        
-        source_data.append({
-            "source": source,
-            "latest": latest,
-            "trend": trend
-        })
-    
+    data = await _dashboard_data()
+
     return templates.TemplateResponse(
         "dashboard.html",
-        {
-            "request": request,
-            "global_sentiment": global_sentiment,
-            "sources": source_data
-        }
+        {"request": request, **data}
     )
 
 
@@ -149,7 +211,6 @@ async def new_source_form(request: Request):
     """
     Form to create a new source.
     """
-    registry = get_registry()
     plugins = registry.list_plugins()
     
     return templates.TemplateResponse(
@@ -157,7 +218,7 @@ async def new_source_form(request: Request):
         {
             "request": request,
             "plugins": plugins,
-            "polarities": list(SentimentPolarity),
+            "polarities": list(SENTIMENT_POLARITIES),
             "source": None
         }
     )
@@ -176,15 +237,12 @@ async def create_source(
     """
     Create a new source instance.
     """
-    import json
-    
     try:
-        config = json.loads(config_json)
-    except json.JSONDecodeError:
+        config = orjson.loads(config_json)
+    except orjson.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON configuration")
     
     # Validate plugin exists
-    registry = get_registry()
     plugin = registry.get_plugin(plugin_id)
     if not plugin:
         raise HTTPException(status_code=404, detail=f"Plugin '{plugin_id}' not found")
@@ -201,7 +259,7 @@ async def create_source(
         enabled=enabled,
         config=config,
         weight=weight,
-        sentiment_polarity=SentimentPolarity(sentiment_polarity),
+        sentiment_polarity=sentiment_polarity,
         schedule=schedule
     )
     
@@ -214,24 +272,34 @@ async def create_source(
     return RedirectResponse(url="/sources", status_code=303)
 
 
-@app.get("/sources/{source_id}", response_class=HTMLResponse)
-async def view_source(request: Request, source_id: str):
+async def require_source(source_id: str) -> SourceInstance:
     """
-    View details of a specific source.
+    Path dependency resolving {source_id} to its SourceInstance.
+
+    Raises 400 for a malformed UUID and 404 for an unknown source, so
+    handlers start from a source that is known to exist.
     """
     try:
-        source = await db.get_source(UUID(source_id))
+        uuid = UUID(source_id)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid UUID")
-    
+
+    source = await db.get_source(uuid)
     if not source:
         raise HTTPException(status_code=404, detail="Source not found")
-    
+
+    return source
+
+
+@app.get("/sources/{source_id}", response_class=HTMLResponse)
+async def view_source(request: Request, source: SourceInstance = Depends(require_source)):
+    """
+    View details of a specific source.
+    """
     # Get recent snapshots
     history = await db.get_snapshot_history(source.source_id, limit=20)
     
     # Get plugin info
-    registry = get_registry()
     plugin_def = registry.get_definition(source.plugin_id)
     
     return templates.TemplateResponse(
@@ -246,19 +314,10 @@ async def view_source(request: Request, source_id: str):
 
 
 @app.get("/sources/{source_id}/edit", response_class=HTMLResponse)
-async def edit_source_form(request: Request, source_id: str):
+async def edit_source_form(request: Request, source: SourceInstance = Depends(require_source)):
     """
     Form to edit an existing source.
     """
-    try:
-        source = await db.get_source(UUID(source_id))
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid UUID")
-    
-    if not source:
-        raise HTTPException(status_code=404, detail="Source not found")
-    
-    registry = get_registry()
     plugins = registry.list_plugins()
     
     return templates.TemplateResponse(
@@ -266,7 +325,7 @@ async def edit_source_form(request: Request, source_id: str):
         {
             "request": request,
             "plugins": plugins,
-            "polarities": list(SentimentPolarity),
+            "polarities": list(SENTIMENT_POLARITIES),
             "source": source,
             "schedule_human": cron_to_human(source.schedule)
         }
@@ -276,6 +335,7 @@ async def edit_source_form(request: Request, source_id: str):
 @app.post("/sources/{source_id}/update")
 async def update_source(
     source_id: str,
+    source: SourceInstance = Depends(require_source),
     plugin_id: str = Form(...),
     display_name: str = Form(...),
     enabled: bool = Form(False),
@@ -287,23 +347,12 @@ async def update_source(
     """
     Update an existing source instance.
     """
-    import json
-    
-    try:
-        source = await db.get_source(UUID(source_id))
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid UUID")
-    
-    if not source:
-        raise HTTPException(status_code=404, detail="Source not found")
-    
     try:
-        config = json.loads(config_json)
-    except json.JSONDecodeError:
+        config = orjson.loads(config_json)
+    except orjson.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON configuration")
     
     # Validate plugin exists
-    registry = get_registry()
     plugin = registry.get_plugin(plugin_id)
     if not plugin:
         raise HTTPException(status_code=404, detail=f"Plugin '{plugin_id}' not found")
@@ -319,7 +368,7 @@ async def update_source(
     source.enabled = enabled
     source.config = config
     source.weight = weight
-    source.sentiment_polarity = SentimentPolarity(sentiment_polarity)
+    source.sentiment_polarity = sentiment_polarity
     source.schedule = schedule
     
     await db.update_source(source)
@@ -350,19 +399,17 @@ async def toggle_source(source_id: str):
     Enable or disable a source.
     """
     try:
-        source = await db.get_source(UUID(source_id))
+        uuid = UUID(source_id)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid UUID")
-    
-    if not source:
+
+    # Atomic flip in one statement — no read-modify-write round trip
+    enabled = await db.toggle_source_enabled(uuid)
+    if enabled is None:
         raise HTTPException(status_code=404, detail="Source not found")
-    
-    # Toggle enabled state
-    source.enabled = not source.enabled
-    await db.update_source(source)
-    
+
     # Update scheduler
-    if source.enabled:
+    if enabled:
         await scheduler.schedule_source(source_id)
     else:
         await scheduler.unschedule_source(source_id)
@@ -376,25 +423,41 @@ async def delete_source(source_id: str):
     Delete a source.
     """
     try:
-        # Unschedule first
-        await scheduler.unschedule_source(source_id)
-        
-        # Delete from database
-        await db.delete_source(UUID(source_id))
-        
-        return {"message": "Source deleted"}
+        uuid = UUID(source_id)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid UUID")
 
+    # The scheduler job and the database rows are independent, so drop
+    # them concurrently instead of paying the two latencies back-to-back
+    await asyncio.gather(
+        scheduler.unschedule_source(source_id),
+        db.delete_source(uuid)
+    )
+
+    # Pure side-effect endpoint: nothing consumes a body, so skip
+    # serialization entirely
+    return Response(status_code=204)
+
+
+_plugins_payload: bytes | None = None
+
 
 @app.get("/api/plugins")
 async def list_plugins():
     """
     API endpoint to list available plugins.
     """
-    registry = get_registry()
-    plugins = registry.list_plugins()
-    return {"plugins": [p.model_dump() for p in plugins]}
+    # The plugin set is fixed after startup discovery, so the response
+    # body is serialized once (lazily, after discovery has run) and
+    # replayed as constant bytes
+    global _plugins_payload
+    payload = _plugins_payload
+    if payload is None:
+        payload = orjson.dumps(
+            {"plugins": PLUGIN_LIST_ADAPTER.dump_python(registry.list_plugins())}
+        )
+        _plugins_payload = payload
+    return Response(content=payload, media_type="application/json")
 
 
 @app.get("/api/sources")
@@ -402,8 +465,21 @@ async def api_list_sources():
     """
     API endpoint to list all sources.
     """
-    sources = await db.list_sources()
-    return {"sources": [s.model_dump() for s in sources]}
+    # The array is serialized by SQLite itself; the handler only wraps
+    # it in the envelope — no per-row model hydration or dump
+    sources_json = await db.list_sources_json()
+    return Response(
+        content=b'{"sources": %s}' % sources_json.encode(),
+        media_type="application/json"
+    )
+
+
+# Same short-TTL single-flight arrangement as the dashboard: the
+# aggregate only moves when the scheduler writes, so concurrent API
+# consumers within the window share one computation
+_GLOBAL_TTL = 5.0
+_global_cache: tuple[float, dict] | None = None
+_global_lock = asyncio.Lock()
 
 
 @app.get("/api/sentiment/global")
@@ -411,10 +487,21 @@ async def api_global_sentiment():
     """
     API endpoint for global sentiment.
     """
-    sentiment = await aggregator.compute_global_sentiment()
-    if sentiment:
-        return sentiment.model_dump()
-    return {"error": "No data available"}
+    global _global_cache
+
+    cached = _global_cache
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    async with _global_lock:
+        cached = _global_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        sentiment = await aggregator.compute_global_sentiment()
+        body = sentiment.model_dump() if sentiment else {"error": "No data available"}
+        _global_cache = (time.monotonic() + _GLOBAL_TTL, body)
+        return body
 
 
 @app.get("/health")
@@ -425,7 +512,8 @@ async def health_check():
     return {
         "status": "healthy",
         "scheduler_running": scheduler.scheduler.running,
-        "source_count": len(await db.list_sources())
+        # Scalar COUNT: no point hydrating every source model per probe
+        "source_count": await db.count_sources()
     }
 
 
@@ -453,9 +541,9 @@ async def api_preview_endpoint(
                     "path": path,
                     "value": value,
                     "type": value_type,
-                    "preview": str(value)[:100] if not isinstance(value, (dict, list)) else f"<{value_type}>"
+                    "preview": preview
                 }
-                for path, value, value_type in paths
+                for path, value, value_type, preview in paths
             ],
             "content_type": result.content_type,
             "status_code": result.status_code,